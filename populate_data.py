@@ -6,6 +6,7 @@
 # Run with: python populate_data.py
 import os
 import django
+from collections import defaultdict
 from datetime import date, timedelta
 from decimal import Decimal
 
@@ -13,11 +14,26 @@ from decimal import Decimal
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'travel_project.settings')
 django.setup()
 
+from django.db import transaction
+from django.db.models import F
 from project.models import Destination, TravelPackage, Customer, Booking
 from django.contrib.auth.models import User
 
+def create_missing(model, objects, key_fields):
+    """
+    Bulk insert the objects whose key fields are not already in the table.
+    Existing keys are read with a single values_list query and checked in a set.
+    Returns the objects that were inserted.
+    """
+    existing = set(model.objects.values_list(*key_fields).iterator(chunk_size=2000))
+    to_create = [obj for obj in objects if tuple(getattr(obj, field) for field in key_fields) not in existing]
+    model.objects.bulk_create(to_create, batch_size=500)
+    return to_create
+
+
+@transaction.atomic
 def populate_database():
-    """Populate the database with sample data"""
+    """Populate the database with sample data in a single transaction"""
 
     print("Starting to populate database...")
 
@@ -67,24 +83,23 @@ def populate_database():
         },
     ]
 
-    destinations = []
-    for dest_data in destinations_data:
-        destination, created = Destination.objects.get_or_create(
-            name=dest_data['name'],
-            country=dest_data['country'],
-            defaults={
-                'description': dest_data['description'],
-                'image_url': dest_data['image_url']
-            }
-        )
-        destinations.append(destination)
-        print(f"   {'Created' if created else 'Found'} destination: {destination}")
+    # Upsert (INSERT ... ON CONFLICT DO UPDATE) keyed on the unique (name, country) constraint
+    destinations = Destination.objects.bulk_create(
+        [Destination(**dest_data) for dest_data in destinations_data],
+        update_conflicts=True,
+        unique_fields=['name', 'country'],
+        update_fields=['description', 'image_url', 'updated_at'],
+        batch_size=500
+    )
+    dest_by_name = {destination.name: destination for destination in destinations}
+
+    print(f"   Saved {len(destinations)} destinations")
 
     # Create Travel Packages
     print("\n3. Creating travel packages...")
     packages_data = [
         {
-            'destination': destinations[0],  # Tokyo
+            'dest_name': 'Tokyo',
             'name': 'Tokyo Adventure Week',
             'price': Decimal('2499.00'),
             'start_date': date.today() + timedelta(days=30),
@@ -99,7 +114,7 @@ Day 7: Last-minute shopping, departure''',
             'available_spots': 15
         },
         {
-            'destination': destinations[0],  # Tokyo
+            'dest_name': 'Tokyo',
             'name': 'Tokyo Food & Culture Tour',
             'price': Decimal('1899.00'),
             'start_date': date.today() + timedelta(days=45),
@@ -112,7 +127,7 @@ Day 5: Last breakfast, departure''',
             'available_spots': 10
         },
         {
-            'destination': destinations[1],  # Paris
+            'dest_name': 'Paris',
             'name': 'Romantic Paris Getaway',
             'price': Decimal('2199.00'),
             'start_date': date.today() + timedelta(days=60),
@@ -126,7 +141,7 @@ Day 6: Last-minute shopping, departure''',
             'available_spots': 20
         },
         {
-            'destination': destinations[2],  # Bali
+            'dest_name': 'Bali',
             'name': 'Bali Beach & Culture',
             'price': Decimal('1599.00'),
             'start_date': date.today() + timedelta(days=40),
@@ -142,7 +157,7 @@ Day 8: Departure''',
             'available_spots': 12
         },
         {
-            'destination': destinations[3],  # NYC
+            'dest_name': 'New York City',
             'name': 'New York City Explorer',
             'price': Decimal('1999.00'),
             'start_date': date.today() + timedelta(days=20),
@@ -156,23 +171,25 @@ Day 5: Last-minute shopping, departure''',
         },
     ]
 
-    packages = []
-    for pkg_data in packages_data:
-        end_date = pkg_data['start_date'] + timedelta(days=pkg_data['duration_days'])
-        package, created = TravelPackage.objects.get_or_create(
-            name=pkg_data['name'],
-            destination=pkg_data['destination'],
-            defaults={
-                'price': pkg_data['price'],
-                'start_date': pkg_data['start_date'],
-                'end_date': end_date,
-                'duration_days': pkg_data['duration_days'],
-                'itinerary': pkg_data['itinerary'],
-                'available_spots': pkg_data['available_spots']
-            }
-        )
-        packages.append(package)
-        print(f"   {'Created' if created else 'Found'} package: {package}")
+    created = len(create_missing(
+        TravelPackage,
+        [
+            TravelPackage(
+                destination=dest_by_name[pkg_data['dest_name']],
+                end_date=pkg_data['start_date'] + timedelta(days=pkg_data['duration_days']),
+                **{k: v for k, v in pkg_data.items() if k != 'dest_name'}
+            )
+            for pkg_data in packages_data
+        ],
+        ('name', 'destination_id')
+    ))
+    package_by_name = {
+        package.name: package
+        for package in TravelPackage.objects.filter(name__in=[p['name'] for p in packages_data])
+    }
+
+    packages = [package_by_name[pkg_data['name']] for pkg_data in packages_data]
+    print(f"   Inserted {created} packages ({len(packages) - created} already existed)")
 
     # Create Customers
     print("\n4. Creating customers...")
@@ -214,84 +231,100 @@ Day 5: Last-minute shopping, departure''',
         },
     ]
 
-    customers = []
-    for cust_data in customers_data:
-        customer, created = Customer.objects.get_or_create(
-            email=cust_data['email'],
-            defaults={
-                'first_name': cust_data['first_name'],
-                'last_name': cust_data['last_name'],
-                'phone': cust_data['phone'],
-                'address': cust_data['address']
-            }
-        )
-        customers.append(customer)
-        print(f"   {'Created' if created else 'Found'} customer: {customer}")
+    # Upsert (INSERT ... ON CONFLICT DO UPDATE) keyed on the unique email
+    customers = Customer.objects.bulk_create(
+        [Customer(**cust_data) for cust_data in customers_data],
+        update_conflicts=True,
+        unique_fields=['email'],
+        update_fields=['first_name', 'last_name', 'phone', 'address', 'updated_at'],
+        batch_size=500
+    )
+    customer_by_email = {customer.email: customer for customer in customers}
+
+    print(f"   Saved {len(customers)} customers")
 
     # Create Bookings
     print("\n5. Creating bookings...")
     bookings_data = [
         {
-            'customer': customers[0],  # John Smith
-            'package': packages[0],     # Tokyo Adventure Week
-            'status': 'confirmed',
+            'customer_email': 'john.smith@email.com',
+            'package_name': 'Tokyo Adventure Week',
+            'status': Booking.CONFIRMED,
             'number_of_people': 2,
             'notes': 'Vegetarian meal preferences'
         },
         {
-            'customer': customers[1],  # Sarah Johnson
-            'package': packages[2],     # Romantic Paris Getaway
-            'status': 'confirmed',
+            'customer_email': 'sarah.j@email.com',
+            'package_name': 'Romantic Paris Getaway',
+            'status': Booking.CONFIRMED,
             'number_of_people': 2,
             'notes': 'Anniversary trip'
         },
         {
-            'customer': customers[2],  # Michael Chen
-            'package': packages[3],     # Bali Beach & Culture
-            'status': 'pending',
+            'customer_email': 'mchen@email.com',
+            'package_name': 'Bali Beach & Culture',
+            'status': Booking.PENDING,
             'number_of_people': 1,
             'notes': 'Solo traveler'
         },
         {
-            'customer': customers[3],  # Emily Williams
-            'package': packages[4],     # NYC Explorer
-            'status': 'confirmed',
+            'customer_email': 'emily.w@email.com',
+            'package_name': 'New York City Explorer',
+            'status': Booking.CONFIRMED,
             'number_of_people': 4,
             'notes': 'Family trip with 2 children'
         },
         {
-            'customer': customers[4],  # David Martinez
-            'package': packages[1],     # Tokyo Food & Culture
-            'status': 'pending',
+            'customer_email': 'david.m@email.com',
+            'package_name': 'Tokyo Food & Culture Tour',
+            'status': Booking.PENDING,
             'number_of_people': 1,
             'notes': 'Interested in photography tours'
         },
     ]
 
-    bookings = []
-    for book_data in bookings_data:
-        total_price = book_data['package'].price * book_data['number_of_people']
-        booking, created = Booking.objects.get_or_create(
-            customer=book_data['customer'],
-            travel_package=book_data['package'],
-            defaults={
-                'status': book_data['status'],
-                'number_of_people': book_data['number_of_people'],
-                'total_price': total_price,
-                'notes': book_data['notes']
-            }
+    booking_keys = [
+        (customer_by_email[book_data['customer_email']], package_by_name[book_data['package_name']], book_data)
+        for book_data in bookings_data
+    ]
+    new_bookings = [
+        Booking(
+            customer=customer,
+            travel_package=package,
+            status=book_data['status'],
+            number_of_people=book_data['number_of_people'],
+            notes=book_data['notes']
         )
-        bookings.append(booking)
-        print(f"   {'Created' if created else 'Found'} booking: {booking}")
+        for customer, package, book_data in booking_keys
+    ]
+    # bulk_create skips Booking.save, so apply its pricing and spot reservation here
+    # using the packages already in memory
+    for booking in new_bookings:
+        booking.total_price = booking.calculate_total_price()
+        booking.reserved_spots = booking.spots_needed()
+    inserted = create_missing(Booking, new_bookings, ('customer_id', 'travel_package_id'))
+    spots_taken = defaultdict(int)
+    for booking in inserted:
+        spots_taken[booking.travel_package_id] += booking.reserved_spots
+    for package_id, spots in spots_taken.items():
+        TravelPackage.objects.filter(pk=package_id).update(available_spots=F('available_spots') - spots)
+    created = len(inserted)
+    booking_lookup = {
+        (booking.customer_id, booking.travel_package_id): booking
+        for booking in Booking.objects.filter(customer__in=customers, travel_package__in=packages)
+    }
+
+    bookings = [booking_lookup[(customer.pk, package.pk)] for customer, package, _ in booking_keys]
+    print(f"   Inserted {created} bookings ({len(bookings) - created} already existed)")
 
     print("\n" + "="*60)
     print("Database population complete!")
     print("="*60)
     print("\nSummary:")
-    print(f"  Destinations: {Destination.objects.count()}")
-    print(f"  Travel Packages: {TravelPackage.objects.count()}")
-    print(f"  Customers: {Customer.objects.count()}")
-    print(f"  Bookings: {Booking.objects.count()}")
+    print(f"  Destinations: {len(destinations)}")
+    print(f"  Travel Packages: {len(packages)}")
+    print(f"  Customers: {len(customers)}")
+    print(f"  Bookings: {len(bookings)}")
     print("\nAdmin login credentials:")
     print("  Username: admin")
     print("  Password: admin123")
@@ -4,9 +4,20 @@
 # Description: Django admin interface configuration for the Travel Booking System.
 # Customizes the admin panel for managing destinations, packages, customers, and bookings.
 
+import csv
+from itertools import chain
 from django.contrib import admin
+from django.http import StreamingHttpResponse
 from .models import Destination, TravelPackage, Customer, Booking
 
+
+class EchoBuffer:
+    """File-like object that hands each written CSV line straight back to the caller"""
+
+    def write(self, value):
+        return value
+
+
 @admin.register(Destination)
 class DestinationAdmin(admin.ModelAdmin):
     """Admin interface for Destination model"""
@@ -22,6 +33,7 @@ class TravelPackageAdmin(admin.ModelAdmin):
     """Admin interface for TravelPackage model"""
     list_display = ['name', 'destination', 'price', 'start_date', 'end_date', 'duration_days', 'available_spots']
     list_filter = ['destination', 'start_date', 'created_at']
+    list_select_related = ['destination']
     search_fields = ['name', 'destination__name', 'itinerary']
     ordering = ['start_date', 'destination']
     date_hierarchy = 'start_date'
@@ -47,10 +59,10 @@ class TravelPackageAdmin(admin.ModelAdmin):
 @admin.register(Customer)
 class CustomerAdmin(admin.ModelAdmin):
     """Admin interface for Customer model"""
-    list_display = ['get_full_name', 'email', 'phone', 'created_at']
+    list_display = ['full_name', 'email', 'phone', 'created_at']
     list_filter = ['created_at']
     search_fields = ['first_name', 'last_name', 'email', 'phone']
-    ordering = ['last_name', 'first_name']
+    ordering = ['full_name']
     date_hierarchy = 'created_at'
     readonly_fields = ['created_at', 'updated_at']
 
@@ -73,6 +85,8 @@ class BookingAdmin(admin.ModelAdmin):
     """Admin interface for Booking model"""
     list_display = ['id', 'customer', 'travel_package', 'booking_date', 'status', 'number_of_people', 'total_price']
     list_filter = ['status', 'booking_date', 'travel_package__destination']
+    list_select_related = ['customer', 'travel_package', 'travel_package__destination']
+    actions = ['export_as_csv']
     search_fields = ['customer__first_name', 'customer__last_name', 'customer__email', 'travel_package__name']
     ordering = ['-booking_date']
     date_hierarchy = 'booking_date'
@@ -91,8 +105,26 @@ class BookingAdmin(admin.ModelAdmin):
         }),
     )
 
-    def save_model(self, request, obj, form, change):
-        """Auto-calculate total price if not manually set"""
-        if not change:  # Only for new bookings
-            obj.total_price = obj.calculate_total_price()
-        super().save_model(request, obj, form, change)
+    @admin.action(description='Export selected bookings to CSV')
+    def export_as_csv(self, request, queryset):
+        """Stream the selected bookings as CSV, fetching rows in chunks instead of all at once"""
+        writer = csv.writer(EchoBuffer())
+        header = ['ID', 'Customer', 'Email', 'Package', 'Destination', 'Booking Date',
+                  'Status', 'People', 'Total Price']
+        rows = (
+            writer.writerow([
+                booking.id,
+                booking.customer.get_full_name(),
+                booking.customer.email,
+                booking.travel_package.name,
+                booking.travel_package.destination.name,
+                booking.booking_date.isoformat(),
+                booking.get_status_display(),
+                booking.number_of_people,
+                booking.total_price,
+            ])
+            for booking in queryset.iterator(chunk_size=2000)
+        )
+        response = StreamingHttpResponse(chain([writer.writerow(header)], rows), content_type='text/csv')
+        response['Content-Disposition'] = 'attachment; filename="bookings.csv"'
+        return response
@@ -4,10 +4,28 @@
 # Description: Form definitions for the Travel Booking System application.
 # Provides model forms for CRUD operations with custom validation and widgets.
 
+from functools import cache
 from django import forms
 from .models import Destination, TravelPackage, Customer, Booking
 
 
+def use_value_choices(field, rows):
+    """
+    Render a ModelChoiceField's options from (id, label) rows instead of model instances.
+    rows is a callable, so the query only runs when the dropdown is rendered, and only once
+    per form even though the widget reads its choices more than once;
+    the queryset is still used to validate the choice.
+    """
+    empty_label = field.empty_label
+
+    @cache
+    def choices():
+        options = list(rows())
+        return options if empty_label is None else [('', empty_label), *options]
+
+    field.choices = choices
+
+
 class DestinationForm(forms.ModelForm):
     """Form for creating and updating destinations"""
 
@@ -39,6 +57,15 @@ class TravelPackageForm(forms.ModelForm):
             'available_spots': forms.NumberInput(attrs={'class': 'form-control', 'placeholder': 'Available spots'}),
         }
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # The dropdown renders from values_list rows; the queryset only validates the submitted id
+        self.fields['destination'].queryset = Destination.objects.only('id')
+        use_value_choices(self.fields['destination'], lambda: [
+            (pk, f"{name}, {country}")
+            for pk, name, country in Destination.objects.values_list('id', 'name', 'country')
+        ])
+
     def clean(self):
         cleaned_data = super().clean()
         start_date = cleaned_data.get('start_date')
@@ -83,25 +110,15 @@ class BookingForm(forms.ModelForm):
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        # Make total_price read-only for new bookings (can be overridden by admin)
+        # The dropdowns render from values_list rows; the querysets only validate the submitted ids
+        # (plus price, used to calculate total_price)
+        self.fields['customer'].queryset = Customer.objects.only('id')
+        self.fields['travel_package'].queryset = TravelPackage.objects.select_related(None).only('id', 'price')
+        use_value_choices(self.fields['customer'], lambda: Customer.objects.values_list('id', 'full_name'))
+        use_value_choices(self.fields['travel_package'], lambda: [
+            (pk, f"{name} - {destination_name}")
+            for pk, name, destination_name in TravelPackage.objects.values_list('id', 'name', 'destination__name')
+        ])
+        # total_price is calculated on save for new bookings (can be overridden by admin)
         if not self.instance.pk:
-            self.fields['total_price'].required = False
             self.fields['total_price'].help_text = 'Will be calculated automatically based on package price and number of people'
-
-    def clean(self):
-        cleaned_data = super().clean()
-        travel_package = cleaned_data.get('travel_package')
-        number_of_people = cleaned_data.get('number_of_people')
-
-        if travel_package and number_of_people:
-            # Check if enough spots are available
-            if number_of_people > travel_package.available_spots:
-                raise forms.ValidationError(
-                    f'Only {travel_package.available_spots} spots available for this package.'
-                )
-
-            # Auto-calculate total price if not set
-            if not cleaned_data.get('total_price'):
-                cleaned_data['total_price'] = travel_package.price * number_of_people
-
-        return cleaned_data
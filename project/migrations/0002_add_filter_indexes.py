@@ -0,0 +1,38 @@
+# Generated by Django 5.2.18 on 2026-10-15 09:24
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('project', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='travelpackage',
+            name='start_date',
+            field=models.DateField(db_index=True, help_text='Package start date'),
+        ),
+        migrations.AddIndex(
+            model_name='booking',
+            index=models.Index(fields=['status', 'booking_date'], name='project_boo_status_ff9f28_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='booking',
+            index=models.Index(fields=['travel_package', 'status'], name='project_boo_travel__3735e7_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='customer',
+            index=models.Index(fields=['last_name', 'first_name'], name='project_cus_last_na_12e476_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='destination',
+            index=models.Index(fields=['country', 'name'], name='project_des_country_88a553_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='travelpackage',
+            index=models.Index(fields=['destination', 'start_date'], name='project_tra_destina_bc9de2_idx'),
+        ),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 5.2.18 on 2026-10-15 09:25
+
+import django.core.validators
+from decimal import Decimal
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('project', '0002_add_filter_indexes'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='booking',
+            name='total_price',
+            field=models.DecimalField(blank=True, decimal_places=2, help_text='Total price for the booking (calculated from the package price if left blank)', max_digits=10, validators=[django.core.validators.MinValueValidator(Decimal('0.01'))]),
+        ),
+    ]
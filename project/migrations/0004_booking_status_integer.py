@@ -0,0 +1,41 @@
+# Generated by Django 5.2.18 on 2026-10-15 09:27
+
+from django.db import migrations, models
+
+
+STATUS_VALUES = {
+    'pending': '1',
+    'confirmed': '2',
+    'cancelled': '3',
+    'completed': '4',
+}
+
+
+def status_to_integer(apps, schema_editor):
+    """Rewrite status strings as the integer codes the new column type expects"""
+    Booking = apps.get_model('project', 'Booking')
+    for text, code in STATUS_VALUES.items():
+        Booking.objects.filter(status=text).update(status=code)
+
+
+def status_to_text(apps, schema_editor):
+    """Restore the original status strings"""
+    Booking = apps.get_model('project', 'Booking')
+    for text, code in STATUS_VALUES.items():
+        Booking.objects.filter(status=code).update(status=text)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('project', '0003_booking_total_price_blank'),
+    ]
+
+    operations = [
+        migrations.RunPython(status_to_integer, status_to_text),
+        migrations.AlterField(
+            model_name='booking',
+            name='status',
+            field=models.PositiveSmallIntegerField(choices=[(1, 'Pending'), (2, 'Confirmed'), (3, 'Cancelled'), (4, 'Completed')], default=1, help_text='Current status of the booking'),
+        ),
+    ]
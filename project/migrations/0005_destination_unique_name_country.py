@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-15 09:29
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('project', '0004_booking_status_integer'),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name='destination',
+            constraint=models.UniqueConstraint(fields=('name', 'country'), name='unique_destination_name_country'),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.18 on 2026-10-15 09:30
+
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('project', '0005_destination_unique_name_country'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='customer',
+            name='full_name',
+            field=models.GeneratedField(db_index=True, db_persist=True, expression=django.db.models.functions.text.Concat('first_name', models.Value(' '), 'last_name'), help_text='First and last name, stored by the database so it can be indexed and sorted', output_field=models.CharField(max_length=201)),
+        ),
+    ]
@@ -0,0 +1,49 @@
+# Generated by Django 5.2.18 on 2026-10-15 09:30
+
+from django.db import migrations
+
+
+# Columns searched with __icontains in the list views. On PostgreSQL that lookup
+# compiles to UPPER(column::text) LIKE UPPER(%s), so the indexes are built on the
+# same expression for the planner to use them.
+TRIGRAM_INDEXES = [
+    ('project_destination', 'name'),
+    ('project_destination', 'country'),
+    ('project_destination', 'description'),
+    ('project_travelpackage', 'name'),
+    ('project_travelpackage', 'itinerary'),
+    ('project_customer', 'first_name'),
+    ('project_customer', 'last_name'),
+    ('project_customer', 'email'),
+    ('project_customer', 'phone'),
+]
+
+
+def create_trigram_indexes(apps, schema_editor):
+    """Add pg_trgm GIN indexes for substring search (PostgreSQL only)"""
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    for table, column in TRIGRAM_INDEXES:
+        schema_editor.execute(
+            f'CREATE INDEX IF NOT EXISTS {table}_{column}_trgm '
+            f'ON {table} USING gin (UPPER({column}::text) gin_trgm_ops)'
+        )
+
+
+def drop_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for table, column in TRIGRAM_INDEXES:
+        schema_editor.execute(f'DROP INDEX IF EXISTS {table}_{column}_trgm')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('project', '0006_customer_full_name'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_trigram_indexes, drop_trigram_indexes),
+    ]
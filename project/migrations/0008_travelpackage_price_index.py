@@ -0,0 +1,20 @@
+# Generated by Django 5.2.18 on 2026-10-15 09:33
+
+import django.core.validators
+from decimal import Decimal
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('project', '0007_search_trigram_indexes'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='travelpackage',
+            name='price',
+            field=models.DecimalField(db_index=True, decimal_places=2, help_text='Price per person in USD', max_digits=10, validators=[django.core.validators.MinValueValidator(Decimal('0.01'))]),
+        ),
+    ]
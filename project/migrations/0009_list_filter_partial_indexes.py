@@ -0,0 +1,25 @@
+# Generated by Django 5.2.18 on 2026-10-15 09:33
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('project', '0008_travelpackage_price_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='booking',
+            index=models.Index(condition=models.Q(('status', 4), _negated=True), fields=['status'], name='booking_open_status_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='travelpackage',
+            index=models.Index(fields=['destination', 'available_spots'], name='package_dest_spots_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='travelpackage',
+            index=models.Index(condition=models.Q(('available_spots__gt', 0)), fields=['start_date'], name='package_open_start_idx'),
+        ),
+    ]
@@ -0,0 +1,37 @@
+# Generated by Django 5.2.18 on 2026-10-15 09:36
+
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+def create_search_text_index(apps, schema_editor):
+    """Add a pg_trgm GIN index so substring search on search_text can use it (PostgreSQL only)"""
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    schema_editor.execute(
+        'CREATE INDEX IF NOT EXISTS project_destination_search_text_trgm '
+        'ON project_destination USING gin (search_text gin_trgm_ops)'
+    )
+
+
+def drop_search_text_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('DROP INDEX IF EXISTS project_destination_search_text_trgm')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('project', '0009_list_filter_partial_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='destination',
+            name='search_text',
+            field=models.GeneratedField(db_persist=True, expression=django.db.models.functions.text.Lower(django.db.models.functions.text.Concat('name', models.Value(' '), 'country', models.Value(' '), 'description', output_field=models.TextField())), help_text='Lowercased name, country and description, stored so search checks one column', output_field=models.TextField()),
+        ),
+        migrations.RunPython(create_search_text_index, drop_search_text_index),
+    ]
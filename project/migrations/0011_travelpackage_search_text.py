@@ -0,0 +1,52 @@
+# Generated by Django 5.2.18 on 2026-10-15 09:37
+
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+# Substring search now reads the stored search_text columns, so the trigram
+# indexes on the large text bodies are no longer used by any query.
+UNUSED_TRIGRAM_INDEXES = [
+    ('project_destination', 'description'),
+    ('project_travelpackage', 'itinerary'),
+]
+
+
+def create_search_text_index(apps, schema_editor):
+    """Index search_text with pg_trgm and drop the body indexes it replaces (PostgreSQL only)"""
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    schema_editor.execute(
+        'CREATE INDEX IF NOT EXISTS project_travelpackage_search_text_trgm '
+        'ON project_travelpackage USING gin (search_text gin_trgm_ops)'
+    )
+    for table, column in UNUSED_TRIGRAM_INDEXES:
+        schema_editor.execute(f'DROP INDEX IF EXISTS {table}_{column}_trgm')
+
+
+def drop_search_text_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('DROP INDEX IF EXISTS project_travelpackage_search_text_trgm')
+    for table, column in UNUSED_TRIGRAM_INDEXES:
+        schema_editor.execute(
+            f'CREATE INDEX IF NOT EXISTS {table}_{column}_trgm '
+            f'ON {table} USING gin (UPPER({column}::text) gin_trgm_ops)'
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('project', '0010_destination_search_text'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='travelpackage',
+            name='search_text',
+            field=models.GeneratedField(db_persist=True, expression=django.db.models.functions.text.Lower(django.db.models.functions.text.Concat('name', models.Value(' '), 'itinerary', output_field=models.TextField())), help_text='Lowercased name and itinerary, stored so search never reads the itinerary itself', output_field=models.TextField()),
+        ),
+        migrations.RunPython(create_search_text_index, drop_search_text_index),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-15 09:43
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('project', '0011_travelpackage_search_text'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='booking',
+            name='reserved_spots',
+            field=models.PositiveIntegerField(default=0, editable=False, help_text='Spots this booking currently holds on its package (none while cancelled)'),
+        ),
+    ]
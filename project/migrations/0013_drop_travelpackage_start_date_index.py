@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-15 09:53
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('project', '0012_booking_reserved_spots'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='travelpackage',
+            name='start_date',
+            field=models.DateField(help_text='Package start date'),
+        ),
+    ]
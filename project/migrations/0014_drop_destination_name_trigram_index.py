@@ -0,0 +1,30 @@
+# Generated by Django 5.2.18 on 2026-10-15 10:05
+
+from django.db import migrations
+
+
+def drop_name_trigram_index(apps, schema_editor):
+    """Drop the destination name trigram index; search reads search_text instead (PostgreSQL only)"""
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('DROP INDEX IF EXISTS project_destination_name_trgm')
+
+
+def create_name_trigram_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute(
+        'CREATE INDEX IF NOT EXISTS project_destination_name_trgm '
+        'ON project_destination USING gin (UPPER(name::text) gin_trgm_ops)'
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('project', '0013_drop_travelpackage_start_date_index'),
+    ]
+
+    operations = [
+        migrations.RunPython(drop_name_trigram_index, create_name_trigram_index),
+    ]
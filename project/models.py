@@ -4,10 +4,20 @@
 # Description: Data models for the Travel Booking System application.
 # Defines four interconnected models: Destination, TravelPackage, Customer, and Booking.
 
-from django.db import models
+from django.db import models, transaction
+from django.db.models import F, Q, Value
+from django.db.models.functions import Concat, Lower
+from django.core.exceptions import ValidationError
 from django.core.validators import MinValueValidator
 from decimal import Decimal
 
+class DestinationManager(models.Manager):
+    """Manager that leaves out the search column, which is only read by the database"""
+
+    def get_queryset(self):
+        return super().get_queryset().defer('search_text')
+
+
 class Destination(models.Model):
     """
     Model representing a travel destination.
@@ -17,15 +27,45 @@ class Destination(models.Model):
     country = models.CharField(max_length=100, help_text="Country where destination is located")
     description = models.TextField(help_text="Detailed description of the destination")
     image_url = models.URLField(max_length=500, blank=True, null=True, help_text="URL to destination image")
+    search_text = models.GeneratedField(
+        expression=Lower(Concat(
+            'name', Value(' '), 'country', Value(' '), 'description', output_field=models.TextField()
+        )),
+        output_field=models.TextField(),
+        db_persist=True,
+        help_text="Lowercased name, country and description, stored so search checks one column"
+    )
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = DestinationManager()
+
     class Meta:
         ordering = ['country', 'name']
+        constraints = [
+            models.UniqueConstraint(fields=['name', 'country'], name='unique_destination_name_country'),
+        ]
+        indexes = [
+            models.Index(fields=['country', 'name']),
+        ]
 
     def __str__(self):
         return f"{self.name}, {self.country}"
 
+    @classmethod
+    def country_list(cls):
+        """Distinct countries in order, read from the (country, name) index"""
+        return list(cls.objects.order_by('country').values_list('country', flat=True).distinct())
+
+
+class TravelPackageManager(models.Manager):
+    """Manager that joins the destination used by TravelPackage.__str__, leaving out the search columns"""
+
+    def get_queryset(self):
+        return super().get_queryset().select_related('destination').defer(
+            'search_text', 'destination__search_text'
+        )
+
 
 class TravelPackage(models.Model):
     """
@@ -42,6 +82,7 @@ class TravelPackage(models.Model):
     price = models.DecimalField(
         max_digits=10,
         decimal_places=2,
+        db_index=True,
         validators=[MinValueValidator(Decimal('0.01'))],
         help_text="Price per person in USD"
     )
@@ -56,11 +97,25 @@ class TravelPackage(models.Model):
         validators=[MinValueValidator(0)],
         help_text="Number of available spots for booking"
     )
+    search_text = models.GeneratedField(
+        expression=Lower(Concat('name', Value(' '), 'itinerary', output_field=models.TextField())),
+        output_field=models.TextField(),
+        db_persist=True,
+        help_text="Lowercased name and itinerary, stored so search never reads the itinerary itself"
+    )
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = TravelPackageManager()
+
     class Meta:
         ordering = ['start_date', 'destination']
+        indexes = [
+            models.Index(fields=['destination', 'start_date']),
+            models.Index(fields=['destination', 'available_spots'], name='package_dest_spots_idx'),
+            # Partial index for upcoming packages that still have room (home page)
+            models.Index(fields=['start_date'], condition=Q(available_spots__gt=0), name='package_open_start_idx'),
+        ]
 
     def __str__(self):
         return f"{self.name} - {self.destination.name}"
@@ -80,11 +135,21 @@ class Customer(models.Model):
     email = models.EmailField(unique=True, help_text="Customer's email address")
     phone = models.CharField(max_length=20, help_text="Customer's phone number")
     address = models.TextField(help_text="Customer's mailing address")
+    full_name = models.GeneratedField(
+        expression=Concat('first_name', Value(' '), 'last_name'),
+        output_field=models.CharField(max_length=201),
+        db_persist=True,
+        db_index=True,
+        help_text="First and last name, stored by the database so it can be indexed and sorted"
+    )
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         ordering = ['last_name', 'first_name']
+        indexes = [
+            models.Index(fields=['last_name', 'first_name']),
+        ]
 
     def __str__(self):
         return f"{self.first_name} {self.last_name}"
@@ -94,16 +159,29 @@ class Customer(models.Model):
         return f"{self.first_name} {self.last_name}"
 
 
+class BookingManager(models.Manager):
+    """Manager that joins the customer and package used by Booking.__str__, leaving out the search columns"""
+
+    def get_queryset(self):
+        return super().get_queryset().select_related(
+            'customer', 'travel_package', 'travel_package__destination'
+        ).defer('travel_package__search_text', 'travel_package__destination__search_text')
+
+
 class Booking(models.Model):
     """
     Model representing a booking made by a customer for a travel package.
     References both Customer and TravelPackage models via foreign keys.
     """
+    PENDING = 1
+    CONFIRMED = 2
+    CANCELLED = 3
+    COMPLETED = 4
     STATUS_CHOICES = [
-        ('pending', 'Pending'),
-        ('confirmed', 'Confirmed'),
-        ('cancelled', 'Cancelled'),
-        ('completed', 'Completed'),
+        (PENDING, 'Pending'),
+        (CONFIRMED, 'Confirmed'),
+        (CANCELLED, 'Cancelled'),
+        (COMPLETED, 'Completed'),
     ]
 
     customer = models.ForeignKey(
@@ -119,10 +197,9 @@ class Booking(models.Model):
         help_text="Travel package being booked"
     )
     booking_date = models.DateTimeField(auto_now_add=True, help_text="Date and time when booking was made")
-    status = models.CharField(
-        max_length=20,
+    status = models.PositiveSmallIntegerField(
         choices=STATUS_CHOICES,
-        default='pending',
+        default=PENDING,
         help_text="Current status of the booking"
     )
     number_of_people = models.IntegerField(
@@ -132,14 +209,28 @@ class Booking(models.Model):
     total_price = models.DecimalField(
         max_digits=10,
         decimal_places=2,
+        blank=True,
         validators=[MinValueValidator(Decimal('0.01'))],
-        help_text="Total price for the booking"
+        help_text="Total price for the booking (calculated from the package price if left blank)"
     )
     notes = models.TextField(blank=True, help_text="Additional notes or special requests")
+    reserved_spots = models.PositiveIntegerField(
+        default=0,
+        editable=False,
+        help_text="Spots this booking currently holds on its package (none while cancelled)"
+    )
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = BookingManager()
+
     class Meta:
         ordering = ['-booking_date']
+        indexes = [
+            models.Index(fields=['status', 'booking_date']),
+            models.Index(fields=['travel_package', 'status']),
+            # Partial index over bookings that are not yet completed (status 4)
+            models.Index(fields=['status'], condition=~Q(status=4), name='booking_open_status_idx'),
+        ]
 
     def __str__(self):
         return f"Booking #{self.id} - {self.customer.get_full_name()} - {self.travel_package.name}"
@@ -147,3 +238,74 @@ class Booking(models.Model):
     def calculate_total_price(self):
         """Calculate total price based on number of people and package price"""
         return self.number_of_people * self.travel_package.price
+
+    def spots_needed(self):
+        """Number of package spots this booking should hold; cancelled bookings hold none"""
+        return 0 if self.status == self.CANCELLED else self.number_of_people
+
+    def previous_reservation(self):
+        """Stored (package id, number of people, status, reserved spots) for a saved booking, else None"""
+        if self._state.adding:
+            return None
+        return Booking._base_manager.filter(pk=self.pk).values_list(
+            'travel_package_id', 'number_of_people', 'status', 'reserved_spots'
+        ).first()
+
+    def clean(self):
+        """Check the package has enough spots left, so forms and the admin show an error instead of failing on save"""
+        if self.travel_package_id is None or self.number_of_people is None:
+            return
+        previous = self.previous_reservation()
+        if previous and previous[:3] == (self.travel_package_id, self.number_of_people, self.status):
+            return
+        available = TravelPackage.objects.filter(pk=self.travel_package_id).values_list(
+            'available_spots', flat=True
+        ).first() or 0
+        if previous and previous[0] == self.travel_package_id:
+            available += previous[3]
+        if self.spots_needed() > available:
+            raise ValidationError({'number_of_people': f'Only {available} spots available for this package.'})
+
+    def reserve_spots(self):
+        """
+        Bring the spots held on the package in line with this booking, releasing what it held before.
+        The check and decrement happen in a single UPDATE so concurrent bookings cannot oversell.
+        Bookings saved before spots were tracked hold none until their package, size or status changes.
+        """
+        held_package, held = self.travel_package_id, 0
+        previous = self.previous_reservation()
+        if previous:
+            if previous[:3] == (self.travel_package_id, self.number_of_people, self.status):
+                self.reserved_spots = previous[3]
+                return
+            held_package, held = previous[0], previous[3]
+
+        if held:
+            TravelPackage.objects.filter(pk=held_package).update(
+                available_spots=F('available_spots') + held
+            )
+
+        needed = self.spots_needed()
+        if needed:
+            reserved = TravelPackage.objects.filter(
+                pk=self.travel_package_id,
+                available_spots__gte=needed
+            ).update(available_spots=F('available_spots') - needed)
+            if not reserved:
+                available = TravelPackage.objects.filter(pk=self.travel_package_id).values_list(
+                    'available_spots', flat=True
+                ).first()
+                raise ValidationError(f'Only {available} spots available for this package.')
+        self.reserved_spots = needed
+
+    def save(self, *args, **kwargs):
+        """Reserve package spots and store the calculated total price when one has not been set"""
+        if not self.total_price:
+            self.total_price = self.calculate_total_price()
+            if kwargs.get('update_fields') is not None:
+                kwargs['update_fields'] = {*kwargs['update_fields'], 'total_price'}
+        if kwargs.get('update_fields') is not None:
+            kwargs['update_fields'] = {*kwargs['update_fields'], 'reserved_spots'}
+        with transaction.atomic():
+            self.reserve_spots()
+            super().save(*args, **kwargs)
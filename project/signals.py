@@ -0,0 +1,46 @@
+# File: signals.py
+# Author: Anthony Xie (xiea@bu.edu)
+# Date: December 9, 2024
+# Description: Signal handlers for the Travel Booking System application.
+# Keeps cached pages in step with the models they display and returns the spots
+# held by deleted bookings to their packages.
+
+from django.core.cache import cache, caches
+from django.db import transaction
+from django.db.models import F
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from .models import Destination, TravelPackage, Customer, Booking
+
+
+@receiver([post_save, post_delete], sender=Destination)
+@receiver([post_save, post_delete], sender=TravelPackage)
+@receiver([post_save, post_delete], sender=Booking)
+def clear_cached_pages(sender, **kwargs):
+    """Drop cached home and destination pages once a change to destinations, packages, or bookings commits"""
+    transaction.on_commit(caches['views'].clear)
+
+
+@receiver([post_save, post_delete], sender=Destination)
+def refresh_destination_choices(sender, **kwargs):
+    """Once the change commits, rebuild the cached country list and drop the destination filter options"""
+    def refresh():
+        cache.delete('destination_choices')
+        cache.set('destination_countries', Destination.country_list(), 300)
+
+    transaction.on_commit(refresh)
+
+
+@receiver([post_save, post_delete], sender=Customer)
+def clear_customer_choices(sender, **kwargs):
+    """Drop the cached customer filter options once the change commits"""
+    transaction.on_commit(lambda: cache.delete('customer_choices'))
+
+
+@receiver(post_delete, sender=Booking)
+def release_booking_spots(sender, instance, **kwargs):
+    """Give a deleted booking's spots back to its package, including bulk and cascade deletes"""
+    if instance.reserved_spots:
+        TravelPackage.objects.filter(pk=instance.travel_package_id).update(
+            available_spots=F('available_spots') + instance.reserved_spots
+        )
@@ -1,3 +1,131 @@
+# File: tests.py
+# Author: Anthony Xie (xiea@bu.edu)
+# Date: December 9, 2024
+# Description: Tests for the Travel Booking System application.
+# Covers how bookings take and return spots on their travel packages.
+
+from datetime import date
+from decimal import Decimal
+from django.core.exceptions import ValidationError
 from django.test import TestCase
+from .forms import BookingForm
+from .models import Destination, TravelPackage, Customer, Booking
+
+
+class BookingSpotTests(TestCase):
+    """Bookings hold spots on their package and give them back when cancelled or deleted"""
+
+    def setUp(self):
+        destination = Destination.objects.create(name='Tokyo', country='Japan', description='Capital city')
+        self.package = self.create_package(destination, 'Tokyo Adventure Week')
+        self.other_package = self.create_package(destination, 'Tokyo Food Tour')
+        self.customer = Customer.objects.create(
+            first_name='Sarah', last_name='Johnson', email='sarah@example.com', phone='555-0101', address='1 Main St'
+        )
+
+    def create_package(self, destination, name):
+        return TravelPackage.objects.create(
+            destination=destination, name=name, price=Decimal('100.00'),
+            start_date=date(2027, 3, 1), end_date=date(2027, 3, 8), duration_days=7,
+            itinerary='Day 1: Arrival', available_spots=10
+        )
+
+    def create_booking(self, number_of_people, **kwargs):
+        booking = Booking(customer=self.customer, travel_package=self.package,
+                          number_of_people=number_of_people, **kwargs)
+        booking.save()
+        return booking
+
+    def assertSpots(self, package, expected):
+        package.refresh_from_db()
+        self.assertEqual(package.available_spots, expected)
+
+    def test_create_reserves_spots(self):
+        booking = self.create_booking(3)
+        self.assertEqual(booking.reserved_spots, 3)
+        self.assertSpots(self.package, 7)
+
+    def test_overbooking_is_rejected(self):
+        with self.assertRaises(ValidationError):
+            self.create_booking(11)
+        self.assertSpots(self.package, 10)
+        self.assertFalse(Booking.objects.exists())
+
+    def test_form_reports_overbooking(self):
+        form = BookingForm(data={
+            'customer': self.customer.pk, 'travel_package': self.package.pk,
+            'status': Booking.PENDING, 'number_of_people': 11, 'total_price': '', 'notes': ''
+        })
+        self.assertFalse(form.is_valid())
+        self.assertIn('number_of_people', form.errors)
+
+    def test_changing_party_size_adjusts_spots(self):
+        booking = self.create_booking(3)
+        booking.number_of_people = 5
+        booking.save()
+        self.assertSpots(self.package, 5)
+        booking.number_of_people = 1
+        booking.save()
+        self.assertSpots(self.package, 9)
+
+    def test_growing_party_can_use_its_own_spots(self):
+        booking = self.create_booking(8)
+        booking.number_of_people = 10
+        booking.full_clean()
+        booking.save()
+        self.assertSpots(self.package, 0)
+
+    def test_changing_package_moves_spots(self):
+        booking = self.create_booking(4)
+        booking.travel_package = self.other_package
+        booking.save()
+        self.assertSpots(self.package, 10)
+        self.assertSpots(self.other_package, 6)
+
+    def test_cancel_and_uncancel(self):
+        booking = self.create_booking(4)
+        booking.status = Booking.CANCELLED
+        booking.save()
+        self.assertEqual(booking.reserved_spots, 0)
+        self.assertSpots(self.package, 10)
+        booking.status = Booking.CONFIRMED
+        booking.save()
+        self.assertEqual(booking.reserved_spots, 4)
+        self.assertSpots(self.package, 6)
+
+    def test_deleting_cancelled_booking_returns_nothing(self):
+        booking = self.create_booking(4, status=Booking.CANCELLED)
+        self.assertSpots(self.package, 10)
+        booking.delete()
+        self.assertSpots(self.package, 10)
+
+    def test_single_delete_returns_spots(self):
+        booking = self.create_booking(4)
+        booking.delete()
+        self.assertSpots(self.package, 10)
+
+    def test_bulk_delete_returns_spots(self):
+        self.create_booking(2)
+        self.create_booking(3)
+        Booking.objects.all().delete()
+        self.assertSpots(self.package, 10)
+
+    def test_customer_cascade_returns_spots(self):
+        self.create_booking(2)
+        booking = Booking(customer=self.customer, travel_package=self.other_package, number_of_people=3)
+        booking.save()
+        self.customer.delete()
+        self.assertSpots(self.package, 10)
+        self.assertSpots(self.other_package, 10)
+
+    def test_package_cascade_deletes_bookings(self):
+        self.create_booking(2)
+        self.package.delete()
+        self.assertFalse(Booking.objects.exists())
 
-# Create your tests here.
+    def test_untracked_booking_returns_nothing(self):
+        Booking.objects.bulk_create([Booking(
+            customer=self.customer, travel_package=self.package, number_of_people=2, total_price=Decimal('200.00')
+        )])
+        Booking.objects.get().delete()
+        self.assertSpots(self.package, 10)
@@ -5,6 +5,7 @@
 # Maps URLs to views for all CRUD operations and list/detail pages.
 
 from django.urls import path
+from django.views.decorators.cache import cache_page
 from . import views
 
 urlpatterns = [
@@ -12,7 +13,7 @@ urlpatterns = [
     path('', views.home, name='home'),
 
     # Destination URLs
-    path('destinations/', views.DestinationListView.as_view(), name='destination-list'),
+    path('destinations/', cache_page(300, cache='views')(views.DestinationListView.as_view()), name='destination-list'),
     path('destinations/<int:pk>/', views.DestinationDetailView.as_view(), name='destination-detail'),
     path('destinations/create/', views.DestinationCreateView.as_view(), name='destination-create'),
     path('destinations/<int:pk>/update/', views.DestinationUpdateView.as_view(), name='destination-update'),
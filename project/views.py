@@ -6,44 +6,133 @@
 # including search and filtering functionality.
 
 from django.shortcuts import render, redirect, get_object_or_404
+from django.http import HttpResponseRedirect
+from django.core.exceptions import ValidationError
 from django.views.generic import ListView, DetailView, CreateView, UpdateView, DeleteView
 from django.urls import reverse_lazy
-from django.db.models import Q
+from django.core.cache import cache
+from django.utils.decorators import method_decorator
+from django.views.decorators.cache import cache_page
+from django.core.paginator import Paginator
+from django.utils.functional import cached_property
+from django.db import connection, connections
+from django.db.models import Q, Count, Max, Prefetch, Case, When, Value, AutoField
 from .models import Destination, TravelPackage, Customer, Booking
 from .forms import DestinationForm, TravelPackageForm, CustomerForm, BookingForm
+from decimal import Decimal, InvalidOperation
+
+# Status filter options, built once instead of on every booking list request
+_STATUS_CHOICES = tuple(Booking.STATUS_CHOICES)
+
+
+def parse_decimal(value):
+    """Return value as a Decimal, or None if it is empty or not a finite number"""
+    try:
+        number = Decimal(value)
+    except InvalidOperation:
+        return None
+    return number if number.is_finite() else None
+
+
+class FastPaginator(Paginator):
+    """
+    Paginator that avoids COUNT(*) for unfiltered lists of large PostgreSQL tables.
+    The planner's row estimate decides whether a table is large; the count then comes from the
+    highest auto-increment primary key, an upper bound, so no real page is ever rejected.
+    Filtered lists, small tables and other databases still get an exact COUNT(*).
+    """
+    estimate_threshold = 10000
+
+    @cached_property
+    def count(self):
+        query = getattr(self.object_list, 'query', None)
+        if query is None or query.where or query.distinct:
+            return super().count
+        model = self.object_list.model
+        db_connection = connections[self.object_list.db]
+        if db_connection.vendor == 'postgresql' and isinstance(model._meta.pk, AutoField):
+            with db_connection.cursor() as cursor:
+                cursor.execute(
+                    'SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass',
+                    [db_connection.ops.quote_name(model._meta.db_table)]
+                )
+                row = cursor.fetchone()
+            if row and row[0] > self.estimate_threshold:
+                # Trailing pages may come back empty when rows have been deleted
+                return model._base_manager.using(self.object_list.db).aggregate(top=Max('pk'))['top'] or 0
+        return super().count
+
+
+class FilterParamsMixin:
+    """Read a list view's filter parameters from the query string once per request"""
+    filter_params = ['search']
+
+    def setup(self, request, *args, **kwargs):
+        super().setup(request, *args, **kwargs)
+        self.filters = {name: request.GET.get(name, '') for name in self.filter_params}
+
+
+class ChangedFieldsUpdateMixin:
+    """Write only the columns the form changed instead of every field on the object"""
+
+    def form_valid(self, form):
+        self.object = form.save(commit=False)
+        if form.changed_data:
+            self.object.save(update_fields=[*form.changed_data, 'updated_at'])
+        return HttpResponseRedirect(self.get_success_url())
+
 
 # Home view
+@cache_page(60, cache='views')
 def home(request):
     """Home page showing overview of the travel booking system"""
+    # Fetch all three totals in a single round trip
+    counts_sql = 'SELECT ' + ', '.join(
+        f'(SELECT COUNT(*) FROM {connection.ops.quote_name(model._meta.db_table)})'
+        for model in (Destination, TravelPackage, Booking)
+    )
+    with connection.cursor() as cursor:
+        cursor.execute(counts_sql)
+        total_destinations, total_packages, total_bookings = cursor.fetchone()
+
     context = {
-        'total_destinations': Destination.objects.count(),
-        'total_packages': TravelPackage.objects.count(),
-        'total_bookings': Booking.objects.count(),
-        'featured_destinations': Destination.objects.all()[:3],
-        'upcoming_packages': TravelPackage.objects.filter(available_spots__gt=0).order_by('start_date')[:4],
+        'total_destinations': total_destinations,
+        'total_packages': total_packages,
+        'total_bookings': total_bookings,
+        'featured_destinations': Destination.objects.only('id', 'name', 'country', 'description')[:3],
+        'upcoming_packages': TravelPackage.objects.select_related('destination').filter(
+            available_spots__gt=0
+        ).order_by('start_date')[:4],
     }
     return render(request, 'project/home.html', context)
 
 
 # Destination Views
-class DestinationListView(ListView):
+class DestinationListView(FilterParamsMixin, ListView):
     """List all destinations"""
     model = Destination
     template_name = 'project/destination_list.html'
     context_object_name = 'destinations'
     paginate_by = 10
+    paginator_class = FastPaginator
+    filter_params = ['search', 'country']
+    ordering = ['country', 'name', 'pk']
 
     def get_queryset(self):
-        queryset = super().get_queryset()
-        search_query = self.request.GET.get('search', '')
-        country_filter = self.request.GET.get('country', '')
+        queryset = super().get_queryset().only('id', 'name', 'country', 'description').annotate(
+            package_count=Count('packages')
+        )
+        search_query = self.filters['search']
+        country_filter = self.filters['country']
 
         if search_query:
-            queryset = queryset.filter(
-                Q(name__icontains=search_query) |
-                Q(country__icontains=search_query) |
-                Q(description__icontains=search_query)
-            )
+            queryset = queryset.filter(search_text__contains=search_query.lower()).annotate(
+                search_rank=Case(
+                    When(name__icontains=search_query, then=Value(2)),
+                    When(country__icontains=search_query, then=Value(1)),
+                    default=Value(0)
+                )
+            ).order_by('-search_rank', 'country', 'name', 'pk')
 
         if country_filter:
             queryset = queryset.filter(country__icontains=country_filter)
@@ -52,18 +141,24 @@ class DestinationListView(ListView):
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        context['search_query'] = self.request.GET.get('search', '')
-        context['country_filter'] = self.request.GET.get('country', '')
-        context['countries'] = Destination.objects.values_list('country', flat=True).distinct()
+        context['search_query'] = self.filters['search']
+        context['country_filter'] = self.filters['country']
+        context['countries'] = cache.get_or_set('destination_countries', Destination.country_list, 300)
         return context
 
 
+@method_decorator(cache_page(600, cache='views'), name='dispatch')
 class DestinationDetailView(DetailView):
     """Show details of a specific destination"""
     model = Destination
     template_name = 'project/destination_detail.html'
     context_object_name = 'destination'
 
+    def get_queryset(self):
+        return super().get_queryset().prefetch_related(
+            Prefetch('packages', queryset=TravelPackage.objects.select_related('destination'))
+        )
+
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         context['packages'] = self.object.packages.all()
@@ -78,7 +173,7 @@ class DestinationCreateView(CreateView):
     success_url = reverse_lazy('destination-list')
 
 
-class DestinationUpdateView(UpdateView):
+class DestinationUpdateView(ChangedFieldsUpdateMixin, UpdateView):
     """Update an existing destination"""
     model = Destination
     form_class = DestinationForm
@@ -94,35 +189,41 @@ class DestinationDeleteView(DeleteView):
 
 
 # TravelPackage Views
-class TravelPackageListView(ListView):
+class TravelPackageListView(FilterParamsMixin, ListView):
     """List all travel packages with filtering"""
     model = TravelPackage
     template_name = 'project/package_list.html'
     context_object_name = 'packages'
     paginate_by = 10
+    paginator_class = FastPaginator
+    filter_params = ['search', 'destination', 'min_price', 'max_price', 'available_only']
+    ordering = ['start_date', 'destination', 'pk']
 
     def get_queryset(self):
-        queryset = super().get_queryset()
-        search_query = self.request.GET.get('search', '')
-        destination_filter = self.request.GET.get('destination', '')
-        min_price = self.request.GET.get('min_price', '')
-        max_price = self.request.GET.get('max_price', '')
-        available_only = self.request.GET.get('available_only', '')
+        queryset = super().get_queryset().select_related('destination').only(
+            'id', 'name', 'price', 'start_date', 'end_date', 'duration_days', 'available_spots',
+            'destination__name', 'destination__country'
+        )
+        search_query = self.filters['search']
+        destination_filter = self.filters['destination']
+        min_price = parse_decimal(self.filters['min_price'])
+        max_price = parse_decimal(self.filters['max_price'])
+        available_only = self.filters['available_only']
 
         if search_query:
-            queryset = queryset.filter(
-                Q(name__icontains=search_query) |
-                Q(destination__name__icontains=search_query) |
-                Q(itinerary__icontains=search_query)
-            )
+            # Each half can use its own index; an OR across the join would scan every package
+            packages = TravelPackage.objects.select_related(None).order_by().values('pk')
+            queryset = queryset.filter(pk__in=packages.filter(search_text__contains=search_query.lower()).union(
+                packages.filter(destination__name__icontains=search_query)
+            ))
 
         if destination_filter:
             queryset = queryset.filter(destination_id=destination_filter)
 
-        if min_price:
+        if min_price is not None:
             queryset = queryset.filter(price__gte=min_price)
 
-        if max_price:
+        if max_price is not None:
             queryset = queryset.filter(price__lte=max_price)
 
         if available_only:
@@ -132,12 +233,16 @@ class TravelPackageListView(ListView):
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        context['search_query'] = self.request.GET.get('search', '')
-        context['destinations'] = Destination.objects.all()
-        context['selected_destination'] = self.request.GET.get('destination', '')
-        context['min_price'] = self.request.GET.get('min_price', '')
-        context['max_price'] = self.request.GET.get('max_price', '')
-        context['available_only'] = self.request.GET.get('available_only', '')
+        context['search_query'] = self.filters['search']
+        context['destinations'] = cache.get_or_set(
+            'destination_choices',
+            lambda: list(Destination.objects.values_list('id', 'name')),
+            300
+        )
+        context['selected_destination'] = self.filters['destination']
+        context['min_price'] = self.filters['min_price']
+        context['max_price'] = self.filters['max_price']
+        context['available_only'] = self.filters['available_only']
         return context
 
 
@@ -147,6 +252,15 @@ class TravelPackageDetailView(DetailView):
     template_name = 'project/package_detail.html'
     context_object_name = 'package'
 
+    def get_queryset(self):
+        return super().get_queryset().prefetch_related(
+            Prefetch('bookings', queryset=Booking.objects.select_related(None).select_related('customer').only(
+                # travel_package_id is needed to attach each booking to the package
+                'id', 'travel_package_id', 'status', 'booking_date', 'number_of_people', 'total_price',
+                'customer__first_name', 'customer__last_name'
+            ))
+        )
+
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         context['bookings'] = self.object.bookings.all()
@@ -161,7 +275,7 @@ class TravelPackageCreateView(CreateView):
     success_url = reverse_lazy('package-list')
 
 
-class TravelPackageUpdateView(UpdateView):
+class TravelPackageUpdateView(ChangedFieldsUpdateMixin, UpdateView):
     """Update an existing travel package"""
     model = TravelPackage
     form_class = TravelPackageForm
@@ -177,16 +291,20 @@ class TravelPackageDeleteView(DeleteView):
 
 
 # Customer Views
-class CustomerListView(ListView):
+class CustomerListView(FilterParamsMixin, ListView):
     """List all customers"""
     model = Customer
     template_name = 'project/customer_list.html'
     context_object_name = 'customers'
     paginate_by = 10
+    paginator_class = FastPaginator
+    ordering = ['last_name', 'first_name', 'pk']
 
     def get_queryset(self):
-        queryset = super().get_queryset()
-        search_query = self.request.GET.get('search', '')
+        queryset = super().get_queryset().only('id', 'first_name', 'last_name', 'email', 'phone').annotate(
+            booking_count=Count('bookings')
+        )
+        search_query = self.filters['search']
 
         if search_query:
             queryset = queryset.filter(
@@ -200,7 +318,7 @@ class CustomerListView(ListView):
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        context['search_query'] = self.request.GET.get('search', '')
+        context['search_query'] = self.filters['search']
         return context
 
 
@@ -210,6 +328,16 @@ class CustomerDetailView(DetailView):
     template_name = 'project/customer_detail.html'
     context_object_name = 'customer'
 
+    def get_queryset(self):
+        return super().get_queryset().prefetch_related(
+            Prefetch(
+                'bookings',
+                queryset=Booking.objects.select_related(None).select_related(
+                    'travel_package', 'travel_package__destination'
+                ).defer('travel_package__search_text', 'travel_package__destination__search_text')
+            )
+        )
+
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         context['bookings'] = self.object.bookings.all()
@@ -224,7 +352,7 @@ class CustomerCreateView(CreateView):
     success_url = reverse_lazy('customer-list')
 
 
-class CustomerUpdateView(UpdateView):
+class CustomerUpdateView(ChangedFieldsUpdateMixin, UpdateView):
     """Update an existing customer"""
     model = Customer
     form_class = CustomerForm
@@ -240,18 +368,38 @@ class CustomerDeleteView(DeleteView):
 
 
 # Booking Views
-class BookingListView(ListView):
+class BookingFormMixin:
+    """Show spot reservation failures from Booking.save as form errors"""
+
+    def form_valid(self, form):
+        try:
+            return super().form_valid(form)
+        except ValidationError as error:
+            form.add_error(None, error)
+            return self.form_invalid(form)
+
+
+class BookingListView(FilterParamsMixin, ListView):
     """List all bookings with filtering"""
     model = Booking
     template_name = 'project/booking_list.html'
     context_object_name = 'bookings'
     paginate_by = 10
+    paginator_class = FastPaginator
+    filter_params = ['search', 'status', 'customer']
+    ordering = ['-booking_date', '-pk']
 
     def get_queryset(self):
-        queryset = super().get_queryset()
-        search_query = self.request.GET.get('search', '')
-        status_filter = self.request.GET.get('status', '')
-        customer_filter = self.request.GET.get('customer', '')
+        queryset = super().get_queryset().select_related(
+            'customer', 'travel_package', 'travel_package__destination'
+        ).only(
+            'id', 'booking_date', 'status', 'number_of_people', 'total_price',
+            'customer__first_name', 'customer__last_name',
+            'travel_package__name', 'travel_package__destination__name'
+        )
+        search_query = self.filters['search']
+        status_filter = self.filters['status']
+        customer_filter = self.filters['customer']
 
         if search_query:
             queryset = queryset.filter(
@@ -260,7 +408,7 @@ class BookingListView(ListView):
                 Q(travel_package__name__icontains=search_query)
             )
 
-        if status_filter:
+        if status_filter.isdigit():
             queryset = queryset.filter(status=status_filter)
 
         if customer_filter:
@@ -270,11 +418,15 @@ class BookingListView(ListView):
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        context['search_query'] = self.request.GET.get('search', '')
-        context['status_choices'] = Booking.STATUS_CHOICES
-        context['selected_status'] = self.request.GET.get('status', '')
-        context['customers'] = Customer.objects.all()
-        context['selected_customer'] = self.request.GET.get('customer', '')
+        context['search_query'] = self.filters['search']
+        context['status_choices'] = _STATUS_CHOICES
+        context['selected_status'] = self.filters['status']
+        context['customers'] = cache.get_or_set(
+            'customer_choices',
+            lambda: list(Customer.objects.values_list('id', 'full_name')),
+            300
+        )
+        context['selected_customer'] = self.filters['customer']
         return context
 
 
@@ -285,7 +437,7 @@ class BookingDetailView(DetailView):
     context_object_name = 'booking'
 
 
-class BookingCreateView(CreateView):
+class BookingCreateView(BookingFormMixin, CreateView):
     """Create a new booking"""
     model = Booking
     form_class = BookingForm
@@ -293,7 +445,7 @@ class BookingCreateView(CreateView):
     success_url = reverse_lazy('booking-list')
 
 
-class BookingUpdateView(UpdateView):
+class BookingUpdateView(BookingFormMixin, ChangedFieldsUpdateMixin, UpdateView):
     """Update an existing booking"""
     model = Booking
     form_class = BookingForm